@@ -1,10 +1,8 @@
 import streamlit as st
-import pandas as pd
-import joblib
 import os
-import numpy as np
 import datetime
-import pycountry
+import serving
+from artifact_manifest import MANIFEST_FILE
 
 # ---- Option mappings: Human-readable for all dropdowns ----
 EXPERIENCE_LEVELS = {
@@ -40,18 +38,22 @@ INV_COMPANY_SIZES = inv_map(COMPANY_SIZES)
 INV_REMOTE_RATIOS = inv_map(REMOTE_RATIOS)
 
 # --- Country code mapping ---
-def country_code_to_name(code):
+def country_code_to_name(code, name_table):
     """Convert ISO 3166-1 alpha-2 country codes to full country names."""
     if isinstance(code, float) or code is None:
         return "Unknown"
+    # Table precomputed by the encoding scripts; pycountry only for older artifacts
+    if name_table:
+        return name_table.get(code, code)
+    import pycountry
     try:
         return pycountry.countries.get(alpha_2=code).name
     except:
         return code
 
-def get_country_options(encoder_key, label_encoders):
+def get_country_options(encoder_key, label_encoders, name_table):
     country_codes = sorted(list(label_encoders[encoder_key].classes_))
-    country_names = [country_code_to_name(c) for c in country_codes]
+    country_names = [country_code_to_name(c, name_table) for c in country_codes]
     code_to_name = dict(zip(country_codes, country_names))
     name_to_code = dict(zip(country_names, country_codes))
     return country_names, code_to_name, name_to_code
@@ -120,25 +122,47 @@ st.caption("Predict your data science salary anywhere in the world. Powered by A
 now_ist = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=5, minutes=30)))
 st.write(f"🕒 **Current date:** {now_ist.strftime('%A, %B %d, %Y, %I:%M %p IST')}")
 
-@st.cache_resource
-def load_all_artifacts():
-    required = [
-        "salary_model.pkl", "preprocessor.pkl", "column_mappings.pkl", "model_info.pkl"
-    ]
-    missing = [f for f in required if not os.path.exists(f)]
-    if missing:
-        return None, None, None, None, missing
-    model = joblib.load("salary_model.pkl")
-    encoders = joblib.load("preprocessor.pkl")
-    column_mappings = joblib.load("column_mappings.pkl")
-    model_info = joblib.load("model_info.pkl")
-    return model, encoders, column_mappings, model_info, None
-
-model, label_encoders, column_mappings, model_info, missing_files = load_all_artifacts()
+# "student" serves the distilled model from distill_model.py (smaller, faster)
+MODEL_VARIANT = os.environ.get("SALARY_MODEL_VARIANT", "teacher")
+if MODEL_VARIANT not in serving.MODEL_FILES:
+    st.error(f"❌ Unknown SALARY_MODEL_VARIANT '{MODEL_VARIANT}'. Allowed: {', '.join(serving.MODEL_FILES)}")
+    st.stop()
+
+missing_files = serving.missing_files(MODEL_VARIANT)
 if missing_files:
     st.error("❌ Required files missing: " + ", ".join(missing_files))
     st.stop()
 
+# Artifacts are checked against each other at build time (validate_artifacts.py);
+# here we only confirm they are the ones that were validated. This must run before
+# anything is unpickled, since loading a tampered pickle already executes it.
+@st.cache_resource
+def check_artifacts():
+    return serving.verify_artifacts(MODEL_VARIANT)
+
+artifacts_validated, manifest_message = check_artifacts()
+if not artifacts_validated:
+    if os.path.exists(MANIFEST_FILE):
+        st.error(f"❌ Artifact validation failed: {manifest_message}")
+        st.stop()
+    st.warning(f"⚠️ Artifacts not validated: {manifest_message}")
+
+@st.cache_resource
+def load_all_artifacts():
+    return serving.load_metadata(MODEL_VARIANT)
+
+# The model (and with it sklearn) is only loaded when the first prediction is requested
+@st.cache_resource
+def load_model(validated):
+    if validated:
+        # Full re-hash of the model is deferred from startup to its first load
+        ok, message = serving.verify_model(MODEL_VARIANT)
+        if not ok:
+            raise ValueError(f"Artifact validation failed: {message}")
+    return serving.load_model(MODEL_VARIANT)
+
+label_encoders, column_mappings, model_info = load_all_artifacts()
+
 def get_options(encoder_key, mapping_dict=None, default=None):
     if encoder_key in label_encoders:
         classes = list(label_encoders[encoder_key].classes_)
@@ -168,11 +192,15 @@ with side_col:
         company_size = INV_COMPANY_SIZES.get(company_size_display, company_size_display)
 
         # Countries - full name only
-        company_names, code2name, name2code = get_country_options("company_location", label_encoders)
+        company_names, code2name, name2code = get_country_options(
+            "company_location", label_encoders, column_mappings.get("country_names")
+        )
         company_location_display = st.selectbox("Company Location", company_names)
         company_location = name2code.get(company_location_display, company_location_display)
 
-        residence_names, res_code2name, res_name2code = get_country_options("employee_residence", label_encoders)
+        residence_names, res_code2name, res_name2code = get_country_options(
+            "employee_residence", label_encoders, column_mappings.get("country_names")
+        )
         employee_residence_display = st.selectbox("Employee Residence", residence_names)
         employee_residence = res_name2code.get(employee_residence_display, employee_residence_display)
 
@@ -182,6 +210,12 @@ with side_col:
 
         work_year = st.selectbox("Work Year", get_options("work_year", None, [2023, 2022, 2021]))
 
+        show_interval = st.checkbox(
+            "Show salary range (P10–P90)",
+            value=True,
+            disabled="interval_calibration" not in model_info
+        )
+
         submitted = st.form_submit_button("🔮 Predict Salary")
 
     st.markdown("ℹ️ _All fields are required. Fields sourced from the latest Kaggle dataset._")
@@ -202,7 +236,6 @@ with main_col:
     st.header("📈 Prediction")
     if submitted:
         try:
-            model_features = model_info["feature_names"]
             input_dict = {
                 "job_role": job_role,
                 "experience_level": experience_level,
@@ -214,22 +247,19 @@ with main_col:
                 "work_year": int(work_year)
             }
 
-            # Encode categorical variables
-            for key, val in input_dict.items():
-                if key in label_encoders:
-                    enc = label_encoders[key]
-                    if val not in enc.classes_:
-                        st.error(f"Unknown category '{val}' for {key}. Valid: {list(enc.classes_)}")
-                        raise ValueError(f"Unknown value '{val}' for {key}")
-                    input_dict[key] = enc.transform([val])[0]
-            for f in model_features:
-                if f not in input_dict:
-                    input_dict[f] = 0
-
-            input_df = pd.DataFrame([[input_dict[f] for f in model_features]], columns=model_features)
-            input_df = input_df.astype(float)
+            # Encode categorical variables into a single model row
+            input_row = serving.encode_profile(
+                input_dict, label_encoders, column_mappings, model_info["feature_names"],
+                validated=artifacts_validated
+            )
 
-            prediction = model.predict(input_df)[0]
+            prediction, p10, p90 = serving.predict_row(load_model(artifacts_validated), input_row, model_info, show_interval)
+            interval_html = ""
+            if p10 is not None:
+                interval_html = (
+                    f"<div style='color:#b7d2ff; font-size:1.05rem;'>"
+                    f"Likely range (P10–P90): ${p10:,.0f} – ${p90:,.0f}</div>"
+                )
 
             st.markdown(
                 f"""
@@ -238,6 +268,7 @@ with main_col:
                     <div style="font-size:2.2rem; font-weight:600; color:#e8f7cd; margin:.1em 0;">
                         ${prediction:,.0f} <span style='font-size:1.15rem; color:#43bea8;'>USD / year</span>
                     </div>
+                    {interval_html}
                     <div style="color:#c9d6e2; margin-top:.7em;">Estimation for this exact role and profile.</div>
                 </div>
                 """,
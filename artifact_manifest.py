@@ -0,0 +1,104 @@
+import hashlib
+import hmac
+import json
+import os
+
+MANIFEST_FILE = "artifact_manifest.json"
+MANIFEST_VERSION = 2
+# HMAC key shared by the build that validates and the app that serves
+SIGNING_KEY_ENV = "ARTIFACT_SIGNING_KEY"
+
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def combined_digest(file_digests):
+    """Single hash over {file: sha256}, independent of dict order."""
+    h = hashlib.sha256()
+    for name in sorted(file_digests):
+        h.update(f"{name}:{file_digests[name]}\n".encode())
+    return h.hexdigest()
+
+
+def _payload(manifest):
+    body = {k: v for k, v in manifest.items() if k != "signature"}
+    return json.dumps(body, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _sign(manifest, key):
+    return hmac.new(key.encode(), _payload(manifest), hashlib.sha256).hexdigest()
+
+
+def write_manifest(files, checks, path=MANIFEST_FILE):
+    """Hash the validated artifacts and write a (signed when a key is set) manifest."""
+    digests = {f: file_digest(f) for f in files}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "files": digests,
+        "sizes": {f: os.path.getsize(f) for f in files},
+        "digest": combined_digest(digests),
+        "checks": checks,
+    }
+    key = os.environ.get(SIGNING_KEY_ENV)
+    manifest["signature"] = _sign(manifest, key) if key else None
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def _load(path):
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version {manifest.get('version')}")
+    return manifest
+
+
+def verify_manifest(files, path=MANIFEST_FILE, defer=()):
+    """Return (ok, message) for the given artifacts as they are on disk.
+
+    Checks the signature (when a signing key is configured), that the digests
+    add up, and the size of each of files; other artifacts in the manifest
+    (e.g. another model variant) are ignored. Files are re-hashed except those
+    in defer, e.g. a large model pickle; check those later with verify_files.
+    """
+    if not os.path.exists(path):
+        return False, f"'{path}' not found. Run: python validate_artifacts.py"
+    try:
+        manifest = _load(path)
+    except ValueError as e:
+        return False, str(e)
+
+    key = os.environ.get(SIGNING_KEY_ENV)
+    if key and not hmac.compare_digest(manifest.get("signature") or "", _sign(manifest, key)):
+        return False, "Manifest signature is invalid"
+    if combined_digest(manifest["files"]) != manifest["digest"]:
+        return False, "Manifest digest does not match its file hashes"
+
+    unknown = [f for f in files if f not in manifest["files"]]
+    if unknown:
+        return False, "Artifacts not covered by the manifest: " + ", ".join(unknown)
+    missing = [f for f in files if not os.path.exists(f)]
+    if missing:
+        return False, "Artifacts listed in the manifest are missing: " + ", ".join(missing)
+    resized = [f for f in files if os.path.getsize(f) != manifest["sizes"][f]]
+    if resized:
+        return False, "Artifacts changed since validation: " + ", ".join(resized)
+    return verify_files([f for f in files if f not in defer], path)
+
+
+def verify_files(files, path=MANIFEST_FILE):
+    """Re-hash files and compare them with the manifest; returns (ok, message)."""
+    manifest = _load(path)
+    unknown = [f for f in files if f not in manifest["files"]]
+    if unknown:
+        return False, "Artifacts not covered by the manifest: " + ", ".join(unknown)
+    changed = [f for f in files if file_digest(f) != manifest["files"][f]]
+    if changed:
+        return False, "Artifacts changed since validation: " + ", ".join(changed)
+    return True, "Artifacts match the validated manifest"
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+import time
+import statistics
+
+import serving
+
+RUNS = 5
+TOP_N = 15
+
+# Both sides pay for streamlit, which app.py always imports
+# What the app used to import at module level before the first paint
+EAGER_IMPORTS = "import streamlit, pandas, joblib, numpy, pycountry, sklearn.ensemble"
+# The old load_all_artifacts: every artifact, model included, before the first paint.
+# The encoders are now preprocessor.npz, so they are loaded the way the current files allow.
+EAGER_FIRST_PAINT = (EAGER_IMPORTS + "; import category_encoding"
+                     "; [joblib.load(f) for f in ('salary_model.pkl', 'column_mappings.pkl', 'model_info.pkl')]"
+                     "; category_encoding.load_vocabularies()")
+LEAN_IMPORTS = "import streamlit, serving"
+# Like the app, fall back to pycountry when column_mappings.pkl has no country table
+LEAN_FIRST_PAINT = (LEAN_IMPORTS + "; _, mappings, _ = serving.load_metadata()"
+                    "; mappings.get('country_names') or __import__('pycountry')")
+LEAN_FIRST_PREDICTION = LEAN_FIRST_PAINT + "; serving.load_model()"
+
+print("⏱️ COLD START BENCHMARK")
+print("=" * 50)
+
+
+def import_profile(code):
+    """Parse -X importtime into (module, cumulative_us, self_us, depth) rows."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        head, cumulative_us, name = line.split("|")
+        # Each nesting level adds two spaces of indentation to the module name
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(cumulative_us), int(head.split(":")[1]), depth))
+    return rows, proc.returncode
+
+
+def cold_start_seconds(code):
+    """Median wall time of a fresh interpreter running code."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        timings.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            return None
+    return statistics.median(timings)
+
+
+for label, code in [("Eager (old app imports)", EAGER_IMPORTS), ("Lean (serving)", LEAN_IMPORTS)]:
+    rows, returncode = import_profile(code)
+    if returncode != 0:
+        print(f"\n❌ {label}: import failed (missing packages?)")
+        continue
+    total_ms = sum(r[1] for r in rows if r[3] == 0) / 1000
+    print(f"\n📦 {label}: {total_ms:.1f} ms total import time")
+    print(f"  {'module':40s}{'cumulative ms':>15s}{'self ms':>10s}")
+    for name, cumulative_us, self_us, depth in sorted(rows, key=lambda r: r[1], reverse=True)[:TOP_N]:
+        print(f"  {'  ' * depth + name:40s}{cumulative_us / 1000:>15.1f}{self_us / 1000:>10.1f}")
+
+print(f"\n🚀 Cold start (median of {RUNS} fresh interpreters):")
+cases = [("Eager imports", EAGER_IMPORTS), ("Lean imports", LEAN_IMPORTS)]
+if not serving.missing_files():
+    # The old app had already loaded the model at first paint, so its first
+    # prediction costs the same as its first paint
+    cases += [
+        ("Eager first paint", EAGER_FIRST_PAINT),
+        ("Lean first paint", LEAN_FIRST_PAINT),
+        ("Lean first prediction", LEAN_FIRST_PREDICTION),
+    ]
+else:
+    print(f"  (artifacts missing: {', '.join(serving.missing_files())}; skipping load timings)")
+for label, code in cases:
+    seconds = cold_start_seconds(code)
+    result = f"{seconds * 1000:,.0f} ms" if seconds is not None else "failed"
+    print(f"  {label:25s}{result:>12s}")
@@ -0,0 +1,212 @@
+import numpy as np
+
+# pandas is imported inside the fitting functions so the app can load
+# vocabularies with numpy alone
+
+# Bump when the on-disk layout of the vocabulary file changes
+FORMAT_VERSION = 1
+VOCAB_PREFIX = "vocab:"
+VOCAB_FILE = "preprocessor.npz"
+
+# Standard feature name -> candidate column names in the raw data
+COLUMN_MAPPINGS = {
+    'education': ['Education', 'education', 'Education Level', 'education_level', 'degree', 'Degree'],
+    'job_role': ['Job Role', 'job_role', 'Job Title', 'job_title', 'Position', 'position', 'Role', 'role'],
+    'location': ['Location', 'location', 'City', 'city', 'Region', 'region', 'Country', 'country'],
+    'company_size': ['Company Size', 'company_size', 'companySize', 'company size'],
+    'employment_type': ['Employment Type', 'employment_type', 'employmentType'],
+    'experience_level': ['Experience Level', 'experience_level', 'experienceLevel'],
+    'remote_ratio': ['Remote Ratio', 'remote_ratio'],
+    'company_location': ['Company Location', 'company_location'],
+    'employee_residence': ['Employee Residence', 'employee_residence', 'Residence'],
+    'work_year': ['Work Year', 'work_year', 'Year']
+}
+# Standard columns holding ISO alpha-2 country codes
+COUNTRY_COLUMNS = ('company_location', 'employee_residence')
+
+
+class Vocabulary:
+    """Sorted category list with the LabelEncoder surface the app relies on."""
+
+    def __init__(self, classes):
+        classes = np.asarray(classes)
+        # Object arrays would need pickle to save; text becomes fixed-width unicode
+        if classes.dtype == object:
+            classes = classes.astype(str)
+        self.classes_ = classes
+
+    def __len__(self):
+        return len(self.classes_)
+
+    def transform(self, values):
+        values = np.asarray(values)
+        if values.dtype == object and self.classes_.dtype.kind == 'U':
+            values = values.astype(str)
+        codes = np.searchsorted(self.classes_, values)
+        clipped = np.minimum(codes, len(self.classes_) - 1)
+        unseen = (codes >= len(self.classes_)) | (self.classes_[clipped] != values)
+        if unseen.any():
+            raise ValueError(f"y contains previously unseen labels: {list(np.unique(values[unseen]))}")
+        return codes
+
+    def inverse_transform(self, codes):
+        return self.classes_[np.asarray(codes)]
+
+
+def resolve_columns(df):
+    """Map standard feature names to the columns actually present in df."""
+    actual_columns = {}
+    for standard_name, possible_names in COLUMN_MAPPINGS.items():
+        for possible_name in possible_names:
+            if possible_name in df.columns:
+                actual_columns[standard_name] = possible_name
+                break
+    return actual_columns
+
+
+def is_text(series):
+    """True for object columns and pandas string dtypes (the default for text on pandas 3)."""
+    import pandas as pd
+    return pd.api.types.is_string_dtype(series) or series.dtype == object
+
+
+def select_columns(df):
+    """Columns to encode: the standard columns plus any other text columns."""
+    columns = resolve_columns(df)
+    for col in df.columns:
+        if col not in columns.values() and is_text(df[col]):
+            columns[col.lower().replace(' ', '_')] = col
+    return columns
+
+
+def prepare_rows(df):
+    """Row/NaN policy for encoding: the rows the model trains on (no missing values)."""
+    return df.dropna()
+
+
+def _text_values(series):
+    if is_text(series):
+        return series.fillna('Unknown').astype(str)
+    return series
+
+
+def encodable_values(series):
+    """Column values as a numpy array, text as fixed-width unicode with NaN -> 'Unknown'."""
+    if is_text(series):
+        return np.asarray(_text_values(series), dtype=str)
+    return series.to_numpy()
+
+
+def _factorize(series):
+    import pandas as pd
+
+    # One hash pass gives both codes and sorted uniques (same codes as LabelEncoder)
+    codes, uniques = pd.factorize(_text_values(series), sort=True)
+    return codes, np.asarray(uniques)
+
+
+def fit_vocabularies(df, columns, n_jobs=1):
+    """Factorize every column in `columns` ({standard_name: actual_column}).
+
+    Returns (codes, vocabularies) where codes is a DataFrame of integer codes
+    indexed like df with the actual column names, and vocabularies is a dict
+    {standard_name: Vocabulary}. With n_jobs > 1 columns are factorized in
+    parallel threads; this is opt-in because factorizing text mostly holds the
+    GIL, so it only helps with many large columns.
+    """
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
+
+    names = list(columns)
+    series = [df[columns[name]] for name in names]
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            fitted = list(pool.map(_factorize, series))
+    else:
+        fitted = [_factorize(s) for s in series]
+
+    codes = pd.DataFrame({columns[name]: c for name, (c, _) in zip(names, fitted)}, index=df.index)
+    vocabularies = {name: Vocabulary(u) for name, (_, u) in zip(names, fitted)}
+    return codes, vocabularies
+
+
+def fit_encoding(df, n_jobs=1):
+    """The single fitting step behind preprocessor.npz.
+
+    Applies prepare_rows, selects the columns and factorizes them. Returns
+    (encoded_df, vocabularies, columns); encoded_df holds the kept rows with
+    the categorical columns replaced by their codes.
+    """
+    df = prepare_rows(df).copy()
+    columns = select_columns(df)
+    codes, vocabularies = fit_vocabularies(df, columns, n_jobs=n_jobs)
+    df[codes.columns] = codes
+    return df, vocabularies, columns
+
+
+def transform_frame(df, columns, vocabularies):
+    """Encode df against existing vocabularies; raises ValueError naming the column."""
+    import pandas as pd
+
+    codes = {}
+    for name, col in columns.items():
+        if name not in vocabularies:
+            raise ValueError(f"No vocabulary for '{name}' ({col})")
+        try:
+            codes[col] = vocabularies[name].transform(encodable_values(df[col]))
+        except ValueError as e:
+            raise ValueError(f"{name} ({col}): {e}") from e
+    return pd.DataFrame(codes, index=df.index)
+
+
+def country_name_table(vocabularies):
+    """ISO 3166-1 alpha-2 code -> country name for the country vocabularies.
+
+    Built once at encoding time so the app can label countries without
+    importing pycountry. Empty when pycountry is not installed.
+    """
+    try:
+        import pycountry
+    except ImportError:
+        return {}
+    table = {}
+    for name in COUNTRY_COLUMNS:
+        if name not in vocabularies:
+            continue
+        for code in map(str, vocabularies[name].classes_):
+            country = pycountry.countries.get(alpha_2=code)
+            table[code] = country.name if country else code
+    return table
+
+
+def column_mapping_info(columns, vocabularies):
+    """Contents of column_mappings.pkl for the encoded columns."""
+    return {
+        'mappings': dict(columns),
+        'reverse_mappings': {v: k for k, v in columns.items()},
+        'country_names': country_name_table(vocabularies)
+    }
+
+
+def save_vocabularies(vocabularies, path=VOCAB_FILE):
+    """Write vocabularies as plain arrays to an uncompressed .npz (no pickle)."""
+    arrays = {VOCAB_PREFIX + name: Vocabulary(vocab.classes_).classes_ for name, vocab in vocabularies.items()}
+    np.savez(path, __version__=np.array(FORMAT_VERSION), **arrays)
+
+    # Round-trip check: the file must load without pickle and give back the same classes
+    loaded = load_vocabularies(path)
+    for key, classes in arrays.items():
+        if not np.array_equal(loaded[key[len(VOCAB_PREFIX):]].classes_, classes):
+            raise ValueError(f"Vocabulary '{key[len(VOCAB_PREFIX):]}' did not survive a save/load round trip")
+
+
+def load_vocabularies(path=VOCAB_FILE):
+    """Read a vocabulary file written by save_vocabularies."""
+    with np.load(path, allow_pickle=False) as data:
+        version = int(data["__version__"])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported vocabulary format version {version} in '{path}' (expected {FORMAT_VERSION})")
+        return {
+            key[len(VOCAB_PREFIX):]: Vocabulary(data[key])
+            for key in data.files if key.startswith(VOCAB_PREFIX)
+        }
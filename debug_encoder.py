@@ -1,13 +1,13 @@
 import pandas as pd
-import joblib
 import os
+from category_encoding import load_vocabularies, VOCAB_FILE
 
 print("🔍 DEBUGGING ENCODER ISSUE")
 print("=" * 50)
 
 # 1. Check if files exist
 print("📁 File Check:")
-files_to_check = ["data.csv", "preprocessor.pkl", "salary_model.pkl"]
+files_to_check = ["data.csv", VOCAB_FILE, "salary_model.pkl"]
 for file in files_to_check:
     exists = "✅" if os.path.exists(file) else "❌"
     print(f"  {exists} {file}")
@@ -36,10 +36,10 @@ else:
 print("\n" + "=" * 50)
 
 # 3. Load and examine the preprocessor
-if os.path.exists("preprocessor.pkl"):
+if os.path.exists(VOCAB_FILE):
     print("🔧 Preprocessor Analysis:")
     try:
-        encoders = joblib.load("preprocessor.pkl")
+        encoders = load_vocabularies(VOCAB_FILE)
         print(f"Type: {type(encoders)}")
         
         if isinstance(encoders, dict):
@@ -57,7 +57,7 @@ if os.path.exists("preprocessor.pkl"):
     except Exception as e:
         print(f"❌ Error loading preprocessor: {e}")
 else:
-    print("❌ preprocessor.pkl not found!")
+    print(f"❌ {VOCAB_FILE} not found!")
 
 print("\n" + "=" * 50)
 print("🔧 SOLUTION RECOMMENDATIONS:")
@@ -67,8 +67,8 @@ print("=" * 50)
 if not os.path.exists("data.csv"):
     print("1. ❌ Create or place your data.csv file in the current directory")
 
-if not os.path.exists("preprocessor.pkl"):
-    print("2. ❌ Run: python generate_encoders.py")
+if not os.path.exists(VOCAB_FILE):
+    print("2. ❌ Run: python preprocess_data.py  # fits the encoders the model is trained on")
 elif os.path.exists("data.csv"):
     # Check column name mismatches
     df = pd.read_csv("data.csv")
@@ -90,5 +90,7 @@ elif os.path.exists("data.csv"):
     print(f"   📋 All columns in dataset: {actual_cols}")
 
 print("\n4. 💡 Quick Fix Commands:")
-print("   python generate_encoders.py  # Regenerate encoders")
+print("   python preprocess_data.py    # Refit encoders (then feature_engineering.py and train_model.py)")
+print("   python generate_encoders.py  # Check encoders against data.csv and write column mappings")
+print("   python validate_artifacts.py # Check all artifacts and write the manifest")
 print("   python debug_encoders.py     # Run this script again to verify")
\ No newline at end of file
@@ -0,0 +1,152 @@
+import io
+import os
+import time
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import r2_score, mean_absolute_error
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+from prediction_intervals import calibrate_intervals, interval_coverage
+from artifact_manifest import file_digest
+
+# Upper bound on synthetic rows; larger grids are sampled uniformly per column
+MAX_GRID_ROWS = 200_000
+LATENCY_RUNS = 200
+
+print("🧪 DISTILLING TEACHER MODEL INTO A COMPACT STUDENT")
+print("=" * 50)
+
+for f in ["final_data.csv", "salary_model.pkl", "model_info.pkl"]:
+    if not os.path.exists(f):
+        print(f"❌ Error: '{f}' not found. Run train_model.py first.")
+        exit(1)
+
+teacher = joblib.load("salary_model.pkl")
+model_info = joblib.load("model_info.pkl")
+feature_names = model_info["feature_names"]
+target_col = model_info["target_name"]
+
+# Same cleaning and split as train_model.py so the holdout is comparable
+df = pd.read_csv("final_data.csv")
+X = df[feature_names].apply(pd.to_numeric, errors='coerce').astype(float)
+y = df[target_col]
+is_good = (~X.isna().any(axis=1))
+X = X[is_good]
+y = y[is_good]
+X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+X_test, X_cal, y_test, y_cal = train_test_split(X_test, y_test, test_size=0.5, random_state=42)
+
+# --- Build the categorical grid the teacher is queried on ---
+rng = np.random.default_rng(42)
+levels = [np.sort(X_train[f].unique()) for f in feature_names]
+grid_size = int(np.prod([len(l) for l in levels], dtype=float))
+if grid_size <= MAX_GRID_ROWS:
+    mesh = np.meshgrid(*levels, indexing='ij')
+    grid = np.column_stack([m.ravel() for m in mesh])
+    print(f"✅ Full grid: {grid_size:,} combinations")
+else:
+    grid = np.column_stack([rng.choice(l, size=MAX_GRID_ROWS) for l in levels])
+    print(f"✅ Grid has {grid_size:,} combinations, sampled {MAX_GRID_ROWS:,}")
+# Keep the observed rows so the student is exact where real traffic lands
+grid = pd.DataFrame(np.vstack([grid, X_train.to_numpy()]), columns=feature_names)
+soft_targets = teacher.predict(grid)
+
+G_train, G_val, t_train, t_val = train_test_split(grid, soft_targets, test_size=0.1, random_state=42)
+
+# --- Candidate students ---
+students = {
+    'Small GBM': GradientBoostingRegressor(random_state=42, n_estimators=60, max_depth=3),
+    'Shallow GBM': GradientBoostingRegressor(random_state=42, n_estimators=150, max_depth=3),
+    'Shallow HistGBM': HistGradientBoostingRegressor(random_state=42, max_iter=200, max_depth=4),
+}
+
+
+def single_row_latency_ms(mdl, row):
+    mdl.predict(row)
+    timings = []
+    for _ in range(LATENCY_RUNS):
+        start = time.perf_counter()
+        mdl.predict(row)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings) * 1000)
+
+
+def artifact_size_kb(mdl):
+    buffer = io.BytesIO()
+    joblib.dump(mdl, buffer)
+    return buffer.tell() / 1024
+
+
+one_row = X_test.iloc[[0]]
+teacher_r2 = r2_score(y_test, teacher.predict(X_test))
+teacher_report = {
+    'R2': teacher_r2,
+    'MAE': mean_absolute_error(y_test, teacher.predict(X_test)),
+    'size_kb': os.path.getsize("salary_model.pkl") / 1024,
+    'latency_ms': single_row_latency_ms(teacher, one_row),
+}
+
+results = {}
+for name, mdl in students.items():
+    mdl.fit(G_train, t_train)
+    results[name] = {
+        'model': mdl,
+        'fidelity_R2': r2_score(t_val, mdl.predict(G_val)),
+        'size_kb': artifact_size_kb(mdl),
+        'latency_ms': single_row_latency_ms(mdl, one_row),
+    }
+    res = results[name]
+    print(f"Student {name}: fidelity R2 vs teacher={res['fidelity_R2']:.4f}, "
+          f"size={res['size_kb']:,.1f} KB, latency={res['latency_ms']:.3f} ms")
+
+# A student is only worth serving if it is both smaller and faster than the teacher
+qualified = [
+    name for name, res in results.items()
+    if res['size_kb'] < teacher_report['size_kb'] and res['latency_ms'] < teacher_report['latency_ms']
+]
+if not qualified:
+    print(f"⚠️ No student is smaller and faster than the teacher "
+          f"({teacher_report['size_kb']:,.1f} KB, {teacher_report['latency_ms']:.3f} ms); nothing saved.")
+    # A student distilled from an earlier teacher must not be served or validated
+    for f in ["salary_model_student.pkl", "student_info.pkl"]:
+        if os.path.exists(f):
+            os.remove(f)
+            print(f"🗑️ Removed stale '{f}'")
+    exit(1)
+
+best_name = max(qualified, key=lambda x: results[x]['fidelity_R2'])
+student = results[best_name]['model']
+student_pred = student.predict(X_test)
+student_report = {
+    'R2': r2_score(y_test, student_pred),
+    'MAE': mean_absolute_error(y_test, student_pred),
+    'size_kb': results[best_name]['size_kb'],
+    'latency_ms': results[best_name]['latency_ms'],
+}
+joblib.dump(student, "salary_model_student.pkl")
+
+print("\n📊 Teacher vs student (holdout):")
+print(f"{'':10s}{'R2':>10s}{'MAE':>12s}{'Size KB':>12s}{'Latency ms':>13s}")
+for label, rep in [("Teacher", teacher_report), ("Student", student_report)]:
+    print(f"{label:10s}{rep['R2']:>10.4f}{rep['MAE']:>12,.0f}{rep['size_kb']:>12,.1f}{rep['latency_ms']:>13.3f}")
+print(f"R2 gap: {teacher_report['R2'] - student_report['R2']:.4f}")
+
+interval_calibration = calibrate_intervals(student, X_cal, y_cal)
+interval_calibration['test_coverage'] = interval_coverage(student, X_test, y_test, interval_calibration)
+
+student_info = {
+    'model_name': best_name,
+    'teacher_name': model_info['model_name'],
+    'teacher_digest': file_digest("salary_model.pkl"),
+    'feature_names': feature_names,
+    'target_name': target_col,
+    'grid_rows': len(grid),
+    'fidelity_R2': results[best_name]['fidelity_R2'],
+    'teacher': teacher_report,
+    'student': student_report,
+    'r2_gap': teacher_report['R2'] - student_report['R2'],
+    'interval_calibration': interval_calibration,
+}
+joblib.dump(student_info, "student_info.pkl")
+print(f"💾 Saved student {best_name} to 'salary_model_student.pkl' and report to 'student_info.pkl'")
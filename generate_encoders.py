@@ -1,7 +1,10 @@
 import pandas as pd
 import joblib
-from sklearn.preprocessing import LabelEncoder
 import os
+from category_encoding import (
+    fit_encoding, load_vocabularies, save_vocabularies, select_columns, prepare_rows,
+    transform_frame, column_mapping_info, VOCAB_FILE
+)
 
 print("🔧 GENERATING ROBUST LABEL ENCODERS")
 print("=" * 50)
@@ -13,50 +16,31 @@ if not os.path.exists("data.csv"):
 df = pd.read_csv("data.csv")
 print(f"✅ Dataset loaded. Shape: {df.shape}")
 
-column_mappings = {
-    'education': ['Education', 'education', 'Education Level', 'education_level', 'degree', 'Degree'],
-    'job_role': ['Job Role', 'job_role', 'Job Title', 'job_title', 'Position', 'position', 'Role', 'role'],
-    'location': ['Location', 'location', 'City', 'city', 'Region', 'region', 'Country', 'country'],
-    'company_size': ['Company Size', 'company_size', 'companySize', 'company size'],
-    'employment_type': ['Employment Type', 'employment_type', 'employmentType'],
-    'experience_level': ['Experience Level', 'experience_level', 'experienceLevel'],
-    'remote_ratio': ['Remote Ratio', 'remote_ratio'],
-    'company_location': ['Company Location', 'company_location'],
-    'employee_residence': ['Employee Residence', 'employee_residence', 'Residence'],
-    'work_year': ['Work Year', 'work_year', 'Year']
-}
-
-actual_columns = {}
-for standard_name, possible_names in column_mappings.items():
-    for possible_name in possible_names:
-        if possible_name in df.columns:
-            actual_columns[standard_name] = possible_name
-            break
-
-# Use all object columns with fallback names if mapping missing
-if not actual_columns:
-    for col in df.select_dtypes(include=['object']).columns:
-        actual_columns[col.lower().replace(' ', '_')] = col
+if os.path.exists(VOCAB_FILE):
+    # Encoders fitted by preprocess_data.py are what the model was trained on:
+    # check them against the data instead of refitting
+    vocabularies = load_vocabularies(VOCAB_FILE)
+    actual_columns = select_columns(prepare_rows(df))
+    try:
+        transform_frame(prepare_rows(df), actual_columns, vocabularies)
+    except ValueError as e:
+        print(f"❌ Error: '{VOCAB_FILE}' does not match data.csv: {e}")
+        print("   Re-run preprocess_data.py, feature_engineering.py and train_model.py.")
+        exit(1)
+    print(f"✅ Existing '{VOCAB_FILE}' encodes data.csv")
+else:
+    _, vocabularies, actual_columns = fit_encoding(df)
+    save_vocabularies(vocabularies, VOCAB_FILE)
+    print(f"💾 Saved encoders to '{VOCAB_FILE}'")
 
 if not actual_columns:
     print("❌ Error: No categorical columns found for encoding!")
     exit(1)
 
-label_encoders = {}
-for standard_name, actual_column in actual_columns.items():
-    le = LabelEncoder()
-    df[actual_column] = df[actual_column].fillna('Unknown')
-    le.fit(df[actual_column])
-    label_encoders[standard_name] = le
-    print(f"Encoded: {standard_name} ({actual_column}) Values: {list(le.classes_)}")
-
-joblib.dump(label_encoders, "preprocessor.pkl")
-print("💾 Saved encoders to 'preprocessor.pkl'")
+for standard_name, vocab in vocabularies.items():
+    if standard_name in actual_columns:
+        print(f"Encoded: {standard_name} ({actual_columns[standard_name]}) Values: {list(vocab.classes_)}")
 
-column_mapping_info = {
-    'mappings': actual_columns,
-    'reverse_mappings': {v: k for k, v in actual_columns.items()}
-}
-joblib.dump(column_mapping_info, "column_mappings.pkl")
+joblib.dump(column_mapping_info(actual_columns, vocabularies), "column_mappings.pkl")
 print("💾 Saved column mappings to 'column_mappings.pkl'")
 print("✅ ENCODER GENERATION COMPLETE!")
@@ -0,0 +1,118 @@
+import weakref
+import numpy as np
+
+# Quantiles reported by the uncertainty mode (P10 / P50 / P90)
+QUANTILES = (0.1, 0.5, 0.9)
+
+# Per-model (n_trees, max_nodes) leaf value tables, built on first use
+_LEAF_VALUES = weakref.WeakKeyDictionary()
+
+
+def supports_tree_quantiles(model):
+    """True when the model is a bagged forest whose trees are independent estimates."""
+    # Imported here so serving only pays for sklearn once a model is loaded
+    from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor
+    return isinstance(model, (RandomForestRegressor, ExtraTreesRegressor)) and hasattr(model, "estimators_")
+
+
+def _leaf_values(model):
+    table = _LEAF_VALUES.get(model)
+    if table is None:
+        values = [tree.tree_.value[:, 0, 0] for tree in model.estimators_]
+        table = np.zeros((len(values), max(len(v) for v in values)))
+        for i, v in enumerate(values):
+            table[i, :len(v)] = v
+        _LEAF_VALUES[model] = table
+    return table
+
+
+def per_tree_predictions(model, X):
+    """Predictions of every tree in the forest, shape (n_trees, n_rows).
+
+    model.apply finds every row's leaf in every tree in one call; the leaf
+    values are then gathered from a cached table with a single fancy index.
+    """
+    if getattr(X, "ndim", 2) == 1:
+        X = np.asarray(X).reshape(1, -1)
+    leaves = model.apply(X)
+    table = _leaf_values(model)
+    return table[np.arange(table.shape[0])[:, None], leaves.T]
+
+
+def _point_and_quantiles(model, X, method, residual_offsets=None):
+    """The model's own prediction and uncalibrated P10/P50/P90 from one scoring pass."""
+    if method == "trees":
+        trees = per_tree_predictions(model, X)
+        # A forest's predict is exactly the mean of its trees
+        return trees.mean(axis=0), np.quantile(trees, QUANTILES, axis=0).T
+    point = np.asarray(model.predict(X), dtype=float)
+    lo_offset, hi_offset = residual_offsets
+    return point, np.column_stack([point + lo_offset, point, point + hi_offset])
+
+
+def raw_quantiles(model, X, method, residual_offsets=None):
+    """Uncalibrated P10/P50/P90 as an array of shape (n_rows, 3)."""
+    return _point_and_quantiles(model, X, method, residual_offsets)[1]
+
+
+def calibrate_intervals(model, X_cal, y_cal):
+    """Fit interval calibration on held-out rows; the result is stored in model_info.
+
+    Forests use the spread of their trees, widened (or narrowed) by a conformal
+    margin so the P10-P90 band covers ~80% of the calibration targets. Other
+    models fall back to empirical quantiles of the calibration residuals. Use
+    rows the model was neither trained nor selected on, and measure coverage
+    with interval_coverage on a different set.
+    """
+    y_cal = np.asarray(y_cal, dtype=float)
+    coverage = QUANTILES[-1] - QUANTILES[0]
+    if supports_tree_quantiles(model):
+        method = "trees"
+        residual_offsets = None
+        q = raw_quantiles(model, X_cal, method)
+        scores = np.maximum(q[:, 0] - y_cal, y_cal - q[:, 2])
+        # Finite-sample corrected conformal level
+        n = len(y_cal)
+        level = min(1.0, np.ceil((n + 1) * coverage) / n)
+        margin = float(np.quantile(scores, level))
+    else:
+        method = "residual"
+        residuals = y_cal - np.asarray(model.predict(X_cal), dtype=float)
+        residual_offsets = tuple(float(v) for v in np.quantile(residuals, [QUANTILES[0], QUANTILES[-1]]))
+        margin = 0.0
+
+    return {
+        "method": method,
+        "quantiles": QUANTILES,
+        "margin": margin,
+        "residual_offsets": residual_offsets,
+    }
+
+
+def interval_coverage(model, X, y, calibration):
+    """Share of targets inside the calibrated P10-P90 band."""
+    y = np.asarray(y, dtype=float)
+    bands = predict_interval(model, X, calibration)
+    return float(np.mean((y >= bands[:, 0]) & (y <= bands[:, 2])))
+
+
+def predict_interval(model, X, calibration):
+    """Calibrated P10/P50/P90 for one or many rows, shape (n_rows, 3)."""
+    q = raw_quantiles(model, X, calibration["method"], calibration.get("residual_offsets"))
+    margin = calibration.get("margin", 0.0)
+    lo = np.minimum(q[:, 0] - margin, q[:, 1])
+    hi = np.maximum(q[:, 2] + margin, q[:, 1])
+    return np.column_stack([lo, q[:, 1], hi])
+
+
+def predict_with_interval(model, X, calibration):
+    """Prediction with its calibrated P10/P90, shape (n_rows, 3): [p10, prediction, p90].
+
+    The prediction equals model.predict and comes from the same pass as the
+    band, so the range costs about one predict call.
+    """
+    point, q = _point_and_quantiles(model, X, calibration["method"], calibration.get("residual_offsets"))
+    margin = calibration.get("margin", 0.0)
+    lo = np.minimum(q[:, 0] - margin, point)
+    hi = np.maximum(q[:, 2] + margin, point)
+    return np.column_stack([lo, point, hi])
@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder
 import joblib
+from category_encoding import fit_encoding, save_vocabularies, column_mapping_info, VOCAB_FILE
 
 # Load dataset
 df = pd.read_csv('data.csv')
@@ -16,21 +16,11 @@ print(df.head())
 print("\n🔍 Null values:")
 print(df.isnull().sum())
 
-# Drop rows with nulls (if any)
-df.dropna(inplace=True)
-
-# Identify categorical columns
-categorical_cols = df.select_dtypes(include=['object']).columns
-print(f"Categorical columns found: {list(categorical_cols)}")
-
-# Dictionary to store label encoders
-label_encoders = {}
-
-# Encode categorical variables
-for col in categorical_cols:
-    le = LabelEncoder()
-    df[col] = le.fit_transform(df[col])
-    label_encoders[col] = le  # Save encoder for later use
+# Drop rows with nulls and encode all categorical columns in one pass; the encoders
+# saved below are the ones generate_encoders.py and the app load
+df, vocabularies, columns_to_encode = fit_encoding(df)
+print(f"Categorical columns found: {list(columns_to_encode.values())}")
+for col in columns_to_encode.values():
     print(f"Encoded: {col}")
 
 # Display cleaned data
@@ -44,5 +34,8 @@ df.to_csv("cleaned_data.csv", index=False)
 print("\nSaved as 'cleaned_data.csv'")
 
 # Save the encoders to file
-joblib.dump(label_encoders, "preprocessor.pkl")
-print("✅ Saved encoders to 'preprocessor.pkl'")
\ No newline at end of file
+save_vocabularies(vocabularies, VOCAB_FILE)
+print(f"✅ Saved encoders to '{VOCAB_FILE}'")
+
+joblib.dump(column_mapping_info(columns_to_encode, vocabularies), "column_mappings.pkl")
+print("✅ Saved column mappings to 'column_mappings.pkl'")
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""Lean serving path for the app.
+
+Only numpy (via category_encoding) is imported at module level; pandas is
+never needed, and joblib/sklearn come in only when artifacts are loaded. The
+single-row path builds a numpy row directly instead of a pandas DataFrame.
+"""
+import os
+import warnings
+
+from category_encoding import VOCAB_FILE
+
+MODEL_FILES = {
+    "teacher": "salary_model.pkl",
+    "student": "salary_model_student.pkl",
+}
+METADATA_FILES = ["column_mappings.pkl", "model_info.pkl"]
+
+
+def check_variant(variant):
+    if variant not in MODEL_FILES:
+        raise ValueError(f"Unknown model variant '{variant}'. Allowed: {', '.join(MODEL_FILES)}")
+
+
+def required_files(variant="teacher"):
+    check_variant(variant)
+    files = [MODEL_FILES[variant], VOCAB_FILE] + METADATA_FILES
+    if variant == "student":
+        files.append("student_info.pkl")
+    return files
+
+
+def missing_files(variant="teacher"):
+    return [f for f in required_files(variant) if not os.path.exists(f)]
+
+
+def load_metadata(variant="teacher"):
+    """Vocabularies, column mappings and model info: everything the form needs."""
+    import joblib
+    from category_encoding import load_vocabularies
+
+    vocabularies = load_vocabularies(VOCAB_FILE)
+    column_mappings = joblib.load("column_mappings.pkl")
+    model_info = joblib.load("model_info.pkl")
+    if variant == "student":
+        # Intervals must be calibrated for the model that is actually served
+        student_info = joblib.load("student_info.pkl")
+        model_info["interval_calibration"] = student_info["interval_calibration"]
+        model_info["model_name"] = student_info["model_name"]
+    return vocabularies, column_mappings, model_info
+
+
+def load_model(variant="teacher"):
+    """Unpickle the model; this is what pulls in sklearn."""
+    import joblib
+    check_variant(variant)
+    return joblib.load(MODEL_FILES[variant])
+
+
+def verify_artifacts(variant="teacher"):
+    """Check the artifacts on disk against the manifest from validate_artifacts.py.
+
+    Only the served variant's files are checked, so a host can ship just the
+    student. Cheap enough for startup: the model pickle is only size-checked
+    here and re-hashed by verify_model before it is first loaded.
+    """
+    from artifact_manifest import verify_manifest
+    return verify_manifest(required_files(variant), defer=[MODEL_FILES[variant]])
+
+
+def verify_model(variant="teacher"):
+    from artifact_manifest import verify_files
+    check_variant(variant)
+    return verify_files([MODEL_FILES[variant]])
+
+
+def encode_profile(profile, vocabularies, column_mappings, feature_names, validated=False):
+    """Encode one profile dict (standard names -> raw values) into a (1, n) float row.
+
+    Raises ValueError for categories the vocabularies have never seen. When the
+    artifacts are validated the friendly membership check is skipped; transform
+    still rejects unseen values.
+    """
+    import numpy as np
+
+    actual_names = column_mappings.get("mappings", {})
+    values = {}
+    for key, val in profile.items():
+        if key in vocabularies:
+            vocab = vocabularies[key]
+            if not validated and val not in vocab.classes_:
+                raise ValueError(f"Unknown category '{val}' for {key}. Valid: {list(vocab.classes_)}")
+            val = vocab.transform([val])[0]
+        # Model features use the raw data column names (e.g. job_title for job_role)
+        values[actual_names.get(key, key)] = val
+    return np.array([[values.get(f, 0) for f in feature_names]], dtype=float)
+
+
+def predict_row(model, row, model_info, with_interval=False):
+    """Return (prediction, p10, p90); p10/p90 are None without an interval.
+
+    The headline prediction always equals model.predict, so showing the range
+    never changes the point estimate; with the range it comes from the same
+    scoring pass instead of a second predict call.
+    """
+    with warnings.catch_warnings():
+        # Models fitted on DataFrames warn when scored on a plain array
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        if with_interval and "interval_calibration" in model_info:
+            from prediction_intervals import predict_with_interval
+            p10, prediction, p90 = predict_with_interval(model, row, model_info["interval_calibration"])[0]
+            return float(prediction), float(p10), float(p90)
+        return float(model.predict(row)[0]), None, None
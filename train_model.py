@@ -5,6 +5,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from prediction_intervals import calibrate_intervals, interval_coverage
 
 # Optional extra models
 try:
@@ -38,6 +39,8 @@ y = y[is_good]
 
 # Split
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+# Half of the held-out rows calibrate the intervals and are never used for model selection
+X_test, X_cal, y_test, y_cal = train_test_split(X_test, y_test, test_size=0.5, random_state=42)
 
 # Models
 models = {
@@ -60,12 +63,19 @@ for name, mdl in models.items():
 best_name = max(results, key=lambda x: results[x]['R2'])
 best_model = results[best_name]['model']
 
+# Calibrate P10/P50/P90 intervals on the calibration split, check coverage on the test split
+interval_calibration = calibrate_intervals(best_model, X_cal, y_cal)
+interval_calibration['test_coverage'] = interval_coverage(best_model, X_test, y_test, interval_calibration)
+print(f"📏 Interval method: {interval_calibration['method']}, "
+      f"test P10-P90 coverage={interval_calibration['test_coverage']:.2%}")
+
 # Save model and info
 joblib.dump(best_model, 'salary_model.pkl')
 model_info = {
     'model_name': best_name,
     'feature_names': list(X.columns),
-    'target_name': target_col
+    'target_name': target_col,
+    'interval_calibration': interval_calibration
 }
 joblib.dump(model_info, 'model_info.pkl')
 print(f"✅ Saved best model {best_name} and info. Top R2={results[best_name]['R2']:.4f}")
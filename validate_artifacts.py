@@ -0,0 +1,113 @@
+import os
+import numpy as np
+import pandas as pd
+import joblib
+import serving
+from category_encoding import prepare_rows, encodable_values, transform_frame
+from artifact_manifest import write_manifest, file_digest, MANIFEST_FILE, SIGNING_KEY_ENV
+
+SAMPLE_ROWS = 5000
+
+print("🔎 VALIDATING ARTIFACTS")
+print("=" * 50)
+
+errors = []
+warnings = []
+
+variants = ["teacher"]
+if os.path.exists(serving.MODEL_FILES["student"]):
+    variants.append("student")
+
+missing = sorted({f for v in variants for f in serving.missing_files(v)})
+if missing:
+    print("❌ Required files missing: " + ", ".join(missing))
+    exit(1)
+
+vocabularies, column_mappings, model_info = serving.load_metadata()
+mappings = column_mappings.get("mappings", {})
+feature_names = model_info["feature_names"]
+
+# --- Encoders vs column mappings ---
+if column_mappings.get("reverse_mappings", {}) != {v: k for k, v in mappings.items()}:
+    errors.append("column_mappings.pkl: reverse_mappings is not the inverse of mappings")
+no_vocab = sorted(set(mappings) - set(vocabularies))
+if no_vocab:
+    errors.append(f"Mapped columns without a vocabulary: {no_vocab}")
+for name, vocab in vocabularies.items():
+    classes = vocab.classes_
+    # Encoding uses searchsorted, so classes must be strictly increasing
+    if len(classes) == 0 or not np.all(classes[1:] > classes[:-1]):
+        errors.append(f"Vocabulary '{name}' is empty or not sorted/unique")
+
+# --- Encoders vs model features ---
+unused = sorted(mappings[k] for k in mappings if mappings[k] not in feature_names)
+if unused:
+    warnings.append(f"Mapped columns the model does not use (inputs ignored): {unused}")
+
+# --- Model(s) vs model_info ---
+for variant in variants:
+    model = serving.load_model(variant)
+    if variant == "student":
+        student_info = joblib.load("student_info.pkl")
+        if list(student_info["feature_names"]) != list(feature_names):
+            errors.append("student_info.pkl feature_names differ from model_info.pkl")
+        if student_info.get("teacher_digest") != file_digest(serving.MODEL_FILES["teacher"]):
+            errors.append("Student was distilled from a different teacher; re-run distill_model.py")
+    if hasattr(model, "feature_names_in_"):
+        if list(model.feature_names_in_) != list(feature_names):
+            errors.append(f"{serving.MODEL_FILES[variant]}: fitted features differ from model_info feature_names")
+    elif getattr(model, "n_features_in_", len(feature_names)) != len(feature_names):
+        errors.append(f"{serving.MODEL_FILES[variant]}: expects {model.n_features_in_} features, "
+                      f"model_info lists {len(feature_names)}")
+if "interval_calibration" not in model_info:
+    warnings.append("model_info.pkl has no interval_calibration (re-run train_model.py for salary ranges)")
+
+# --- Encoders vs a sample of the data ---
+if os.path.exists("data.csv"):
+    header = pd.read_csv("data.csv", nrows=0).columns
+    absent = sorted(c for c in mappings.values() if c not in header)
+    if absent:
+        errors.append(f"Mapped columns missing from data.csv: {absent}")
+    present = {k: c for k, c in mappings.items() if c in header and k in vocabularies}
+    # Same row/NaN policy as the encoding step, so the rows line up with cleaned_data.csv
+    sample = prepare_rows(pd.read_csv("data.csv", nrows=SAMPLE_ROWS))
+    unseen_found = False
+    for name, col in present.items():
+        unseen = np.setdiff1d(encodable_values(sample[col]), vocabularies[name].classes_)
+        if len(unseen):
+            unseen_found = True
+            errors.append(f"{len(unseen)} value(s) of '{col}' not in vocabulary '{name}': {list(unseen[:5])}")
+    print(f"✅ Checked {len(sample):,} sample rows of data.csv")
+
+    # --- Encoders vs the codes the model was trained on ---
+    if os.path.exists("cleaned_data.csv") and not unseen_found:
+        trained = pd.read_csv("cleaned_data.csv", nrows=len(sample))
+        served = transform_frame(sample, present, vocabularies)
+        if len(trained) != len(served):
+            errors.append("cleaned_data.csv does not line up with data.csv; re-run preprocess_data.py")
+        else:
+            for name, col in present.items():
+                if col not in trained.columns:
+                    continue
+                mismatched = int((trained[col].to_numpy() != served[col].to_numpy()).sum())
+                if mismatched:
+                    errors.append(f"Vocabulary '{name}' encodes {mismatched} row(s) of '{col}' differently "
+                                  f"from cleaned_data.csv (training codes)")
+    elif not os.path.exists("cleaned_data.csv"):
+        warnings.append("cleaned_data.csv not found; skipped training-code check")
+else:
+    warnings.append("data.csv not found; skipped data sample checks")
+
+for w in warnings:
+    print(f"⚠️ {w}")
+for e in errors:
+    print(f"❌ {e}")
+if errors:
+    print(f"❌ Validation failed with {len(errors)} error(s); manifest not written.")
+    exit(1)
+
+files = sorted({f for v in variants for f in serving.required_files(v)})
+manifest = write_manifest(files, {"variants": variants, "warnings": warnings})
+signed = "signed" if manifest["signature"] else f"unsigned (set {SIGNING_KEY_ENV} to sign)"
+print(f"💾 Saved {signed} manifest to '{MANIFEST_FILE}' (digest {manifest['digest'][:12]})")
+print("✅ ARTIFACT VALIDATION COMPLETE!")